@@ -0,0 +1,48 @@
+# atomic_file.py
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+
+def _replacement_mode(filename: str) -> int:
+    """
+    Returns the permission bits for a file about to replace filename: the existing file's
+    mode if there is one, otherwise 0o666 masked by the process umask, as open() would use.
+    """
+    try:
+        return stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        # The umask can only be read by setting it, so put it straight back
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextmanager
+def atomic_write(filename: str, buffering: int = -1) -> Iterator[BinaryIO]:
+    """
+    Yields a binary file to write the new contents of filename into. The data goes to a
+    temporary file next to it, which is fsynced and os.replace()d into place when the block
+    ends, so readers only ever see the old or the new complete file. If the block raises,
+    the temporary file is removed and filename is left untouched.
+    """
+    # mkstemp picks a unique name, so two writers saving the same file never share a temporary
+    # (it opens the file in binary mode, which stops newline translation on Windows)
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=buffering) as f:
+            # mkstemp creates the file owner-only; give it the permissions open() would have
+            os.chmod(tmp_filename, _replacement_mode(filename))
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        # Never leave a half-written temporary file behind
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+        raise
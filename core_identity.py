@@ -1,8 +1,33 @@
+import sys
+from types import MappingProxyType
+
+# Import exhaustive list of registered planets and age conversion factors:
+from planet_data_model import Planets_Rot
+from planet_data_model_2 import Planets_Year
+
+# Read-only merge of both registries: planet -> (year offset, rotation factor).
+# Only planets present in *both* tables can have their age calculated.
+_PLANET_DATA = MappingProxyType({
+    planet: (Planets_Year[planet], Planets_Rot[planet])
+    for planet in Planets_Year.keys() & Planets_Rot.keys()
+})
+
+# Divider lines used by the printed reports
+_BAR100 = 100 * "="
+_DASH15 = 15 * "-"
+
+
 class CoreIdentity():
     """
         A parent class that defines the identifying information of an individual within an 
         Alien school system database.
     """
+    # Fixed attribute layout instead of a per-instance __dict__. The name attributes are
+    # stored in underscored slots behind the properties below.
+    __slots__ = ('unique_system_id', 'dob', '_first_name', '_last_name',
+                 'gender', 'species', 'home_planet', '_middle_name', 'preferred_name',
+                 '_full_name_simple_cache')
+
     # Let's add some default values. don't forget from chapter 8 that default values are 
     # to be added last within the arguments of a definition.
     def __init__(self, 
@@ -11,6 +36,8 @@ class CoreIdentity():
                  gender, species, home_planet,
                  middle_name="", preferred_name=""):
         """Initialize attributes"""
+        # Cache for full_name_simple(); must exist before the name setters below run
+        self._full_name_simple_cache = None
         # Attributes
         self.unique_system_id = unique_system_id
         """dob is entered as a list in day/month/year format, as based on the indivdiual's planet"""
@@ -23,6 +50,39 @@ class CoreIdentity():
         self. middle_name = middle_name
         self.preferred_name = preferred_name 
 
+    # Name attributes are properties so that the cached names are reset whenever
+    # any part of the name changes.
+    def _reset_name_caches(self):
+        """Drops cached name strings. Subclasses that cache their own names extend this."""
+        self._full_name_simple_cache = None
+
+    @property
+    def first_name(self):
+        return self._first_name
+
+    @first_name.setter
+    def first_name(self, value):
+        self._first_name = value
+        self._reset_name_caches()
+
+    @property
+    def middle_name(self):
+        return self._middle_name
+
+    @middle_name.setter
+    def middle_name(self, value):
+        self._middle_name = value
+        self._reset_name_caches()
+
+    @property
+    def last_name(self):
+        return self._last_name
+
+    @last_name.setter
+    def last_name(self, value):
+        self._last_name = value
+        self._reset_name_caches()
+
     # Methods
 
     # Print Person's full name 
@@ -42,14 +102,16 @@ class CoreIdentity():
     def full_name_simple(self):
         """a simpler definition for the person's full name that skips the preferred_name logic
         """
-        # Initialize variable: 
-        indiv_full_name_simp = ""
-        
+        # Return the cached name if it has already been built (reset by the name setters)
+        if self._full_name_simple_cache is not None:
+            return self._full_name_simple_cache
+
         if self.middle_name:
-            indiv_full_name_simp += f"{self.first_name} {self.middle_name} {self.last_name}"
+            indiv_full_name_simp = f"{self.first_name} {self.middle_name} {self.last_name}"
         else:
-            indiv_full_name_simp += f"{self.first_name} {self.last_name}"
+            indiv_full_name_simp = f"{self.first_name} {self.last_name}"
 
+        self._full_name_simple_cache = indiv_full_name_simp
         return indiv_full_name_simp
 
     # New method added:
@@ -66,20 +128,51 @@ class CoreIdentity():
         """A simple function that returns the full registration of an individual with
             all of the attributes of the CoreIdentity Class
         """
-        print(100 * "=")
-        print("📃Full Registration Info")
-        print(100 * "=")
-        # To use the method as an object, use dot notation with self
-        self.full_name()
-
-        #print other identifiers
-        print(f"Unique ID: {self.unique_system_id}")
-        print(f"Date of Birth (DOB): {self.dob}")
-        print(f"Species: {self.species}")
-        print(f"Home Planet: {self.home_planet}")
+        lines = [
+            _BAR100,
+            "📃Full Registration Info",
+            _BAR100,
+            # To use the method as an object, use dot notation with self
+            self.full_name(),
+            #print other identifiers
+            f"Unique ID: {self.unique_system_id}",
+            f"Date of Birth (DOB): {self.dob}",
+            f"Species: {self.species}",
+            f"Home Planet: {self.home_planet}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Helper function - Calculate individual's age (earth years) compared to native years
     
+    def compute_age(self, current_year):
+        """
+        Pure (print-free) core of age_adjust, usable for batch age calculations.
+
+        :param current_year: The current Earth year (e.g., 2025).
+        :return: Tuple (individual_earth_age, individual_hp_age) as unrounded floats,
+                 or None if the home planet is not in the registry.
+        """
+        # 1. Obtaining planet offset and rotation factor with a single lookup
+        planet_data = _PLANET_DATA.get(self.home_planet)
+        if planet_data is None:
+            return None
+        planet_year_offset, planet_rot_factor = planet_data
+
+        # We assume the last element of the DOB list is the birth year in the planet's native cycle.
+        # dob: [day, month, year]
+        birth_year = self.dob[-1]
+
+        # 2. Calculating current planet year (Person's home planet)
+        current_planet_year = current_year + planet_year_offset
+
+        # 3. Calculating Persons age (in their home planet years)
+        individual_hp_age = current_planet_year - birth_year
+
+        # 4. Calculating Person's age (in earth years via conversion)
+        individual_earth_age = individual_hp_age * planet_rot_factor
+
+        return individual_earth_age, individual_hp_age
+
     def age_adjust(self, current_year):
         """
         Calculates an individual's age in their home planet's native years and the equivalent 
@@ -98,48 +191,29 @@ class CoreIdentity():
                  If successful: rounded float ages. 
                  If data missing: string values "-- Unknown --".
         """
-        # Import exhaustive list of registered planets and age conversion factors: 
-        from planet_data_model import Planets_Rot
-        from planet_data_model_2 import Planets_Year
-
-        # We assume the last element of the DOB list is the birth year in the planet's native cycle.
-        # dob: [day, month, year]
-        birth_year = self.dob[-1]
-
-        # Use an AND condition to check if the home planet is in *both* required dictionaries
-        if self.home_planet in Planets_Year and self.home_planet in Planets_Rot:
-            
-            # 1. Obtaining planet offset
-            planet_year_offset = Planets_Year[self.home_planet]
-            planet_rot_factor = Planets_Rot[self.home_planet]
-
-            # 2. Calculating current planet year (Person's home planet)
-            current_planet_year = current_year + planet_year_offset
-
-            # 3. Calculating Persons age (in their home planet years)
-            individual_hp_age = current_planet_year - birth_year
+        ages = self.compute_age(current_year)
 
-            # 4. Calculating Person's age (in earth years via conversion)
-            individual_earth_age = individual_hp_age * planet_rot_factor
+        if ages is not None:
+            individual_earth_age, individual_hp_age = ages
 
             # Print statement
             simple_name = self.full_name_simple() # Use the proper method call
 
-            print(15 * "-")
+            print(_DASH15)
             # Rounding for clean display
             print(f"{simple_name}'s age on {self.home_planet} is {individual_hp_age:.2f} native years.")
             print(f"{simple_name}'s age in Earth years is {individual_earth_age:.2f} Earth years.")
-            print(15 * "-")
+            print(_DASH15)
             
             return round(individual_earth_age, 2), round(individual_hp_age, 2)
             
         else: 
-            print(15 * "-")
+            print(_DASH15)
             print("Age cannot be calculated due to Person's home planet not in registry.")
             print("Please provide home planet. If home planet cannot be provided, please fill")
             print("out form F-8294 and report to Administrator office No. 423.")
             print("Until then, age will be given as -- Unknown --")
-            print(15 * "-")
+            print(_DASH15)
             
             # Explicitly define and return the unknown string output as requested by the user
             individual_hp_age = "-- Unknown --"
@@ -1,6 +1,36 @@
 import json # New required import for JSON serialization
 from student import Student 
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Tuple, Iterator
+from json_io import dumps_compact
+from atomic_file import atomic_write
+
+# Size of the write buffer used when exporting the master gradebook (1 MiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+def _make_report_entry(student: Student, course: str) -> Dict[str, str]:
+    """Builds one row of the final grade report for a student in the given course."""
+    # Assumes the student's report_card holds the final grade result under the course name
+    final_grade_data = student.report_card.get(course)
+    
+    if final_grade_data and isinstance(final_grade_data, dict):
+        # We expect final_grade_data to be a dictionary like {'percentage': 92.5, 'letter_grade': 'A-'}
+        percentage = final_grade_data.get('percentage', 'N/A')
+        # Only numeric percentages can take the :.2f format; anything else is shown as-is
+        if isinstance(percentage, (int, float)):
+            percentage = f"{percentage:.2f}%"
+        letter_grade = final_grade_data.get('letter_grade', 'N/A')
+    else:
+        percentage = 'Pending'
+        letter_grade = 'Pending'
+    
+    return {
+        'Student Name': student.full_name_simple(),
+        'Student ID': student.sid,
+        'Course': course,
+        'Final Grade Percentage': percentage,
+        'Final Letter Grade': letter_grade,
+    }
+
 
 class CourseManager:
     """
@@ -10,10 +40,14 @@ class CourseManager:
     def __init__(self, course_name: str):
         self.course_name = course_name
         self.students: List[Student] = [] # This list will hold Student objects
+        # Index of the same Student objects keyed by sid for O(1) lookups
+        self._student_by_id: Dict[str, Student] = {}
 
     def enroll_student(self, student_object: Student):
         """Adds a student object to the course roster."""
         self.students.append(student_object)
+        # setdefault keeps the first enrollment for a sid, matching the old linear scan
+        self._student_by_id.setdefault(student_object.sid, student_object)
         print(f"Enrolled: {student_object.full_name_simple()} in {self.course_name}.")
 
     def find_student_by_id(self, student_id: str) -> Union[Student, None]:
@@ -21,82 +55,100 @@ class CourseManager:
         Finds and returns a Student object from the roster by their unique system ID (sid).
         Returns the Student object if found, otherwise returns None.
         """
-        for student in self.students:
-            if student.sid == student_id:
-                return student
-        print(f"Warning: Student with ID '{student_id}' not found in course roster for {self.course_name}.")
-        return None
+        student = self._student_by_id.get(student_id)
+        if student is None:
+            print(f"Warning: Student with ID '{student_id}' not found in course roster for {self.course_name}.")
+        return student
 
-    def generate_master_gradebook(self) -> List[Dict[str, Any]]:
+    def compute_all_ages(self, current_year: int) -> Dict[str, Union[Tuple[float, float], None]]:
         """
-        Generates a master gradebook as a single flat list of dictionaries,
-        where each dictionary represents one single grade entry from any student.
+        Computes (Earth age, home planet age) for every enrolled student without printing,
+        keyed by sid. Students whose home planet is not in the registry map to None.
         """
-        master_gradebook = []
+        ages = {}
+        for student in self.students:
+            student_ages = student.compute_age(current_year)
+            if student_ages is not None:
+                earth_age, hp_age = student_ages
+                student_ages = (round(earth_age, 2), round(hp_age, 2))
+            ages[student.sid] = student_ages
+        return ages
 
+    def _iter_master_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yields the master gradebook rows one at a time, in student enrollment order."""
         # 1. Iterate over every student enrolled in the course
         for student in self.students:
+            # Fetch the identifiers once per student rather than once per grade entry
+            student_name = student.full_name_simple()
+            student_id = student.sid
             
-            # 2. Get the student's individual, flat list of detailed grades
-            student_grades = student.get_grades_for_master_book() 
+            # 2. Get the student's individual, flat list of detailed grades, and
+            # 3. build one master row per grade entry with the student's identifiers added
+            #    (the dict merge copies the entry and adds both keys in one step)
+            for grade_entry in student.get_grades_for_master_book():
+                yield {**grade_entry, 'Student Name': student_name, 'Student ID': student_id}
 
-            # 3. Iterate over each individual grade entry (row)
-            for grade_entry in student_grades:
-                # 4. Create a new dictionary entry for the master book
-                master_row = grade_entry.copy()
-                
-                # Crucial step: Add the student's identifier to the row
-                master_row['Student Name'] = student.full_name_simple()
-                master_row['Student ID'] = student.sid
-                
-                # 5. Append the complete row to the master list
-                master_gradebook.append(master_row)
+    def generate_master_gradebook(self) -> List[Dict[str, Any]]:
+        """
+        Generates a master gradebook as a single flat list of dictionaries,
+        where each dictionary represents one single grade entry from any student.
+        """
+        master_gradebook = list(self._iter_master_rows())
 
         print(f"Master Gradebook for '{self.course_name}' generated with {len(master_gradebook)} total entries.")
         return master_gradebook
 
-    def export_master_gradebook_json(self, filepath: str):
+    def export_master_gradebook_json(self, filepath: str, pretty: bool = False):
         """
         Generates the master gradebook and exports it to a JSON file at the specified filepath.
-        The data is saved with an indent of 4 for readability.
+        The data is saved compactly in a single buffered write; pass pretty=True to save it
+        with an indent of 4 for readability.
         """
         try:
             gradebook_data = self.generate_master_gradebook()
+            if pretty:
+                payload = json.dumps(gradebook_data, indent=4).encode('utf-8')
+            else:
+                payload = dumps_compact(gradebook_data)
             
-            with open(filepath, 'w') as f:
-                json.dump(gradebook_data, f, indent=4)
+            with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(payload)
                 
             print(f"Success: Master gradebook exported to '{filepath}'.")
         except Exception as e:
             print(f"Error exporting gradebook to JSON: {e}")
+
+    def export_master_gradebook_json_streaming(self, filepath: str):
+        """
+        Exports the same compact JSON as export_master_gradebook_json, but writes each master
+        gradebook row to the buffered file as soon as it is built, so the full list of rows
+        (and one large JSON string) is never held in memory.
+        The rows go to a temporary file next to filepath that replaces it only once complete,
+        so a failure part way through never leaves a truncated export behind.
+        """
+        try:
+            row_count = 0
+            with atomic_write(filepath, buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(b'[')
+                for row in self._iter_master_rows():
+                    if row_count:
+                        f.write(b',')
+                    f.write(dumps_compact(row))
+                    row_count += 1
+                f.write(b']')
+
+            print(f"Success: Master gradebook ({row_count} entries) streamed to '{filepath}'.")
+        except Exception as e:
+            print(f"Error exporting gradebook to JSON: {e}")
             
     def generate_final_grade_report(self) -> List[Dict[str, str]]:
         """
         Generates a summary report of the final calculated grades (percentage and letter grade)
         for all students in the course, using the data stored in the student's report_card.
         """
-        final_report = []
+        course = self.course_name
+        students = self.students
         
-        print(f"\n--- Generating Final Grade Report for {self.course_name} ({len(self.students)} Students) ---")
+        print(f"\n--- Generating Final Grade Report for {course} ({len(students)} Students) ---")
         
-        for student in self.students:
-            # Assumes the student's report_card holds the final grade result under the course name
-            final_grade_data = student.report_card.get(self.course_name)
-            
-            report_entry = {
-                'Student Name': student.full_name_simple(),
-                'Student ID': student.sid,
-                'Course': self.course_name,
-            }
-            
-            if final_grade_data and isinstance(final_grade_data, dict):
-                # We expect final_grade_data to be a dictionary like {'percentage': 92.5, 'letter_grade': 'A-'}
-                report_entry['Final Grade Percentage'] = f"{final_grade_data.get('percentage', 'N/A'):.2f}%"
-                report_entry['Final Letter Grade'] = final_grade_data.get('letter_grade', 'N/A')
-            else:
-                report_entry['Final Grade Percentage'] = 'Pending'
-                report_entry['Final Letter Grade'] = 'Pending'
-
-            final_report.append(report_entry)
-
-        return final_report
+        return [_make_report_entry(student, course) for student in students]
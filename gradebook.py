@@ -1,60 +1,182 @@
 import json
 import os
+import sys
+from functools import lru_cache
 from typing import List, Dict, Union, Tuple
+from status_log import get_status_logger
+from json_io import dumps_compact, loads
+from atomic_file import atomic_write
+
+# GradeBook status messages go through this logger. By default they are printed to stdout
+# exactly as before; callers can silence them with
+# logging.getLogger('gradebook').setLevel(logging.WARNING), which also skips the formatting.
+log = get_status_logger(__name__)
+
+# Keys every assignment dict must carry to be stored in a GradeBook
+_REQUIRED_KEYS = frozenset(('title', 'type', 'score', 'weight'))
+
+# Divider lines used by display_grades
+_BAR80 = "=" * 80
+_DASH80 = "-" * 80
+# Pre-built formatters for the display_grades header and assignment rows
+_HEADER_ROW = f"{'TITLE':<30}{'TYPE':<10}{'SCORE':<10}{'WEIGHT':<10}{'CONTRIBUTION':<20}"
+_ROW_FMT = "{:<30}{:<10}{:>7.2f}% {:>7.2f} {:>15.2f} points".format
+
+
+@lru_cache(maxsize=1024)
+def _compute_filename(course_name: str, student_name: str, student_id: str) -> str:
+    """
+    Builds the standardized JSON filename for a (course, student) pair. Cached so that
+    GradeBooks repeatedly created for the same student share one string.
+    """
+    # Example: Quantum_Theory_Koriandr_Starr_S456.json
+    safe_course = course_name.replace(" ", "_")
+    safe_name = student_name.replace(" ", "_").replace(".", "")
+    return f"{safe_course}_{safe_name}_{student_id}.json"
+
+
+def _weighted_totals(scores: List[float], weights: List[float]) -> Tuple[float, float]:
+    """
+    Grade math kernel over parallel score/weight columns (scores out of 100).
+    Returns (sum of (score / 100) * weight, sum of weights).
+    """
+    total_weighted_sum = 0.0
+    total_weight_applied = 0.0
+    for score, weight in zip(scores, weights):
+        total_weighted_sum += (score / 100.0) * weight
+        total_weight_applied += weight
+    return total_weighted_sum, total_weight_applied
 
 class GradeBook:
     """
     Manages assignment scores and weights for a single student in a single course,
     with methods for persistent storage to a JSON file and grade calculation.
+    Use `with GradeBook(...) as gb:` to batch several updates into a single save.
     """
     def __init__(self, course_name: str, student_id: str, student_name: str):
         """Initializes the GradeBook, immediately attempting to load existing data."""
         self.course_name = course_name
         self.student_id = student_id
         self.student_name = student_name
+        # The persistence filename never changes for a GradeBook, so build it once here
+        self._filename = _compute_filename(course_name, student_name, student_id)
         # Internal storage for assignments
         # FIX: Explicitly updated the docstring and type hint to include 'type' (the assignment type).
         # Each entry: {'title': str, 'type': str, 'score': float, 'weight': float}
         self.assignment_entries: List[Dict[str, Union[str, float]]] = []
+        # Maps each lowercased title to its position in assignment_entries for O(1) lookups
+        self._title_index: Dict[str, int] = {}
+        # (inode, size, mtime ns) of the JSON file as of our last load/save, None if never seen.
+        # mtime alone is too coarse to spot a save by another GradeBook right after ours, but
+        # every save os.replace()s in a new file, so the inode changes on each write.
+        self._file_signature: Union[Tuple[int, int, int], None] = None
+        # Write coalescing: inside a `with gradebook:` block saves are deferred and the
+        # GradeBook is only marked dirty; the block's exit (or flush()) writes once.
+        self._dirty = False
+        self._defer_depth = 0
         # Try to load existing grades if the file exists
         self.load_grades()
 
     def get_filename(self) -> str:
-        """Generates the standardized filename for the JSON persistence."""
-        # Example: Quantum_Theory_Koriandr_Starr_S456.json
-        safe_course = self.course_name.replace(" ", "_")
-        safe_name = self.student_name.replace(" ", "_").replace(".", "")
-        return f"{safe_course}_{safe_name}_{self.student_id}.json"
-
-    def save_grades(self):
-        """Saves the current assignment_entries to the persistent JSON file."""
-        filename = self.get_filename()
+        """Returns the standardized filename for the JSON persistence (computed in __init__)."""
+        return self._filename
+
+    def _rebuild_title_index(self):
+        """Rebuilds the lowercased title -> list position index from assignment_entries."""
+        self._title_index = {}
+        for i, entry in enumerate(self.assignment_entries):
+            # setdefault keeps the first occurrence, matching the old first-match scan
+            self._title_index.setdefault(str(entry.get('title', '')).lower(), i)
+
+    @staticmethod
+    def _signature(st: os.stat_result) -> Tuple[int, int, int]:
+        """Identifies one version of the JSON file: (inode, size, mtime ns)."""
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _record_file_signature(self):
+        """Remembers the JSON file's current signature (None if it does not exist)."""
+        try:
+            self._file_signature = self._signature(os.stat(self._filename))
+        except OSError:
+            self._file_signature = None
+
+    def _file_changed_on_disk(self) -> bool:
+        """True if the JSON file was written by someone else since our last load/save."""
+        try:
+            return self._signature(os.stat(self._filename)) != self._file_signature
+        except OSError:
+            return False
+
+    def save_grades(self, pretty: bool = False):
+        """
+        Saves the current assignment_entries to the persistent JSON file.
+        The JSON is serialized once to bytes and written atomically (temporary file plus
+        os.replace); pass pretty=True to indent it for reading by hand.
+        """
+        filename = self._filename
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.assignment_entries, f, indent=4)
-            print(f"[GB] Successfully saved assignments to {filename}.")
+            if pretty:
+                payload = json.dumps(self.assignment_entries, indent=4).encode('utf-8')
+            else:
+                payload = dumps_compact(self.assignment_entries)
+            with atomic_write(filename) as f:
+                f.write(payload)
+            self._record_file_signature()
+            self._dirty = False
+            log.info("[GB] Successfully saved assignments to %s.", filename)
         except Exception as e:
-            print(f"[GB ERROR] Failed to save grades to {filename}: {e}")
+            log.error("[GB ERROR] Failed to save grades to %s: %s", filename, e)
+
+    def _persist_changes(self):
+        """Saves right away, or only marks the GradeBook dirty while saves are deferred."""
+        if self._defer_depth:
+            self._dirty = True
+        else:
+            self.save_grades()
+
+    def flush(self):
+        """Writes any changes held back inside a `with gradebook:` block to the JSON file."""
+        if self._dirty:
+            self.save_grades()
+
+    def __enter__(self):
+        """Defers saves from add_grades_to_json/remove_assignment until the block exits."""
+        self._defer_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Writes the coalesced changes once when the outermost block exits."""
+        self._defer_depth -= 1
+        if not self._defer_depth:
+            self.flush()
+        return False
 
     def load_grades(self):
         """Loads existing assignments from the persistent JSON file into memory."""
-        filename = self.get_filename()
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r') as f:
-                    self.assignment_entries = json.load(f)
+        filename = self._filename
+        # Open directly and treat a missing file as the "new entry" case, rather than
+        # paying for a separate os.path.exists() check first
+        try:
+            # Unbuffered: the whole file is read in one go, so a BufferedReader would only add a copy
+            with open(filename, 'rb', buffering=0) as f:
+                # Remember the signature of the file actually read (fstat, no second path lookup)
+                self._file_signature = self._signature(os.fstat(f.fileno()))
+                self.assignment_entries = loads(f.read())
             # We assume JSON loading is fine, but the old data might be missing 'type'.
             # When new data with 'type' is saved, this is implicitly fixed.
-                print(f"[GB] Successfully loaded existing grades from {filename}.")
-            except json.JSONDecodeError:
-                print(f"[GB WARNING] JSON file {filename} is corrupt or empty. Starting fresh.")
-                self.assignment_entries = []
-            except Exception as e:
-                print(f"[GB ERROR] Failed to load grades from {filename}: {e}")
-        else:
-            print(f"[GB] No existing grade file found for {self.student_name}. Starting new entry.")
+            log.info("[GB] Successfully loaded existing grades from %s.", filename)
+        except FileNotFoundError:
+            log.info("[GB] No existing grade file found for %s. Starting new entry.", self.student_name)
+        except json.JSONDecodeError:
+            # Saves are atomic, so this only happens for files damaged or edited outside GradeBook
+            log.warning("[GB WARNING] JSON file %s is corrupt or empty. Starting fresh.", filename)
+            self.assignment_entries = []
+        except Exception as e:
+            log.error("[GB ERROR] Failed to load grades from %s: %s", filename, e)
+        self._rebuild_title_index()
 
-    def add_grades_to_json(self, new_assignments: List[Dict[str, Union[str, float]]]):
+    def add_grades_to_json(self, new_assignments: List[Dict[str, Union[str, float]]],
+                           refresh: bool = False):
         """
         Updates existing assignments (by title) or adds new ones to the GradeBook, 
         then saves the result to the JSON file.
@@ -62,36 +184,43 @@ class GradeBook:
         Args:
             new_assignments: A list of dicts, e.g., 
                 [{'title': 'Midterm', 'type': 'Exam', 'score': 92.0, 'weight': 0.3}]
+            refresh: If True, always reload the file before updating. Otherwise the
+                in-memory entries are used unless another writer changed the file.
         """
-        # Ensure we have the latest data from the file before updating
-        self.load_grades() 
+        # Only re-read the file if asked to, or if another writer touched it since our last load/save
+        # (unsaved changes held back inside a `with` block are never thrown away implicitly)
+        if refresh or (not self._dirty and self._file_changed_on_disk()):
+            self.load_grades()
+        
+        # Bind the list and its title index as locals for the loop
+        entries = self.assignment_entries
+        title_index = self._title_index
         
         for new_a in new_assignments:
-            found = False
-            for i, existing_a in enumerate(self.assignment_entries):
-                # Check if an assignment with the same title already exists (case-insensitive)
-                if existing_a['title'].lower() == new_a['title'].lower():
-                    # Update existing entry with new score, type, and weight
-                    if all(key in new_a for key in ['score', 'weight', 'type']):
-                        self.assignment_entries[i]['score'] = new_a['score']
-                        self.assignment_entries[i]['weight'] = new_a['weight']
-                        self.assignment_entries[i]['type'] = new_a['type'] # Included 'type' update
-                        print(f"Updated: {new_a['title']} (Type: {new_a['type']}, Score: {new_a['score']}, Weight: {new_a['weight']})")
-                        found = True
-                        break
+            # Ensure all required keys are present before updating or appending
+            if not _REQUIRED_KEYS.issubset(new_a):
+                # FIX: Warn about missing 'type' if it's not present, alongside score/weight.
+                log.warning("[GB WARNING] Skipping assignment due to missing fields (must have title, type, score, weight): %s", new_a)
+                continue
             
-            if not found:
+            # Check if an assignment with the same title already exists (case-insensitive)
+            title_key = new_a['title'].lower()
+            i = title_index.get(title_key)
+            if i is not None:
+                # Update existing entry with new score, type, and weight
+                existing_a = entries[i]
+                existing_a['score'] = new_a['score']
+                existing_a['weight'] = new_a['weight']
+                existing_a['type'] = new_a['type'] # Included 'type' update
+                log.info("Updated: %s (Type: %s, Score: %s, Weight: %s)", new_a['title'], new_a['type'], new_a['score'], new_a['weight'])
+            else:
                 # If the title is new, append it
-                # Ensure all required keys are present before appending
-                if all(key in new_a for key in ['title', 'score', 'weight', 'type']):
-                    self.assignment_entries.append(new_a)
-                    print(f"Added New Assignment: {new_a['title']} (Type: {new_a['type']}, Score: {new_a['score']}, Weight: {new_a['weight']})")
-                else:
-                    # FIX: Warn about missing 'type' if it's not present, alongside score/weight.
-                    print(f"[GB WARNING] Skipping assignment due to missing fields (must have title, type, score, weight): {new_a}")
+                title_index[title_key] = len(entries)
+                entries.append(new_a)
+                log.info("Added New Assignment: %s (Type: %s, Score: %s, Weight: %s)", new_a['title'], new_a['type'], new_a['score'], new_a['weight'])
         
-        # Save the combined and updated list back to the file
-        self.save_grades()
+        # Save the combined and updated list back to the file (deferred inside a `with` block)
+        self._persist_changes()
 
     # --- NEW FEATURE 1: Grade Calculation ---
     def calculate_weighted_score(self) -> Tuple[float, float, float]:
@@ -102,21 +231,25 @@ class GradeBook:
         Returns:
             Tuple[float, float, float]: (Current Weighted Score, Total Weight Applied, Score % of Completed Work)
         """
-        total_weighted_sum = 0.0
-        total_weight_applied = 0.0
-        
+        # Nothing recorded yet (common at course start): skip the totals and the division entirely
+        if not self.assignment_entries:
+            return 0.0, 0.0, 0.0
+
+        # Validate each entry once, splitting the valid ones into score and weight columns
+        scores: List[float] = []
+        weights: List[float] = []
         for entry in self.assignment_entries:
             try:
                 score = float(entry.get('score', 0.0))
                 weight = float(entry.get('weight', 0.0))
-                
-                # Calculate contribution: (score / 100) * weight
-                weighted_contribution = (score / 100.0) * weight
-                total_weighted_sum += weighted_contribution
-                total_weight_applied += weight
-                
             except (TypeError, ValueError) as e:
-                print(f"[GB CALC ERROR] Skipping entry '{entry.get('title', 'Unknown')}' due to invalid data: {e}")
+                log.warning("[GB CALC ERROR] Skipping entry '%s' due to invalid data: %s", entry.get('title', 'Unknown'), e)
+                continue
+            scores.append(score)
+            weights.append(weight)
+
+        # Contribution of each entry is (score / 100) * weight
+        total_weighted_sum, total_weight_applied = _weighted_totals(scores, weights)
         
         # Calculate the score percentage based on completed weight (if weight is > 0)
         score_percent_completed = 0.0
@@ -141,42 +274,63 @@ class GradeBook:
         Returns:
             True if the assignment was found and removed, False otherwise.
         """
-        original_length = len(self.assignment_entries)
-        
-        # Create a new list without the matching assignment(s)
-        self.assignment_entries = [
-            a for a in self.assignment_entries 
-            if a.get('title', '').lower() != title_to_remove.lower()
-        ]
-        
-        new_length = len(self.assignment_entries)
+        entries = self.assignment_entries
+        title_index = self._title_index
+        title_key = title_to_remove.lower()
         
-        if new_length < original_length:
-            print(f"[GB SUCCESS] Removed assignment(s) with title '{title_to_remove}'.")
-            self.save_grades()
-            return True
+        if len(title_index) == len(entries):
+            # Every title is distinct, so the index alone locates the only match
+            removed_index = title_index.pop(title_key, None)
+            if removed_index is None:
+                log.warning("[GB WARNING] Assignment '%s' not found.", title_to_remove)
+                return False
+            del entries[removed_index]
+            # Shift the positions of every entry that came after the removed one
+            for other_key, i in title_index.items():
+                if i > removed_index:
+                    title_index[other_key] = i - 1
         else:
-            print(f"[GB WARNING] Assignment '{title_to_remove}' not found.")
-            return False
+            # A file edited by hand can hold several entries with the same title and the index
+            # only knows the first, so create a new list without any of the matching assignments
+            self.assignment_entries = [
+                a for a in entries 
+                if str(a.get('title', '')).lower() != title_key
+            ]
+            if len(self.assignment_entries) == len(entries):
+                log.warning("[GB WARNING] Assignment '%s' not found.", title_to_remove)
+                return False
+            self._rebuild_title_index()
+        
+        log.info("[GB SUCCESS] Removed assignment(s) with title '%s'.", title_to_remove)
+        self._persist_changes()
+        return True
 
     # --- NEW FEATURE 3: Display Reporting ---
     def display_grades(self):
         """
         Prints a formatted report of all assignments and the calculated grade.
         """
-        print("\n" + "="*80)
-        print(f"GRADE REPORT: {self.course_name} for {self.student_name} (ID: {self.student_id})")
-        print("="*80)
+        # Collect the report lines and emit them with a single write to stdout (one lock and
+        # flush instead of one per print); the other view methods follow the same pattern
+        lines = [
+            "\n" + _BAR80,
+            f"GRADE REPORT: {self.course_name} for {self.student_name} (ID: {self.student_id})",
+            _BAR80,
+        ]
 
         if not self.assignment_entries:
-            print("No assignments recorded yet.")
-            print("="*80)
+            lines.append("No assignments recorded yet.")
+            lines.append(_BAR80)
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
         # FIX: Added 'TYPE' column to the display
-        print(f"{'TITLE':<30}{'TYPE':<10}{'SCORE':<10}{'WEIGHT':<10}{'CONTRIBUTION':<20}")
-        print("-" * 80)
+        lines.append(_HEADER_ROW)
+        lines.append(_DASH80)
         
+        # Bind the row formatter and list append as locals for the loop
+        fmt = _ROW_FMT
+        add_line = lines.append
         for entry in self.assignment_entries:
             title = str(entry.get('title', 'N/A'))
             # FIX: Safely retrieve 'type' and default if not present (for old data)
@@ -188,16 +342,17 @@ class GradeBook:
             contribution = (score / 100.0) * weight
             
             # FIX: Included 'type' in the print formatting
-            print(f"{title:<30}{type_val:<10}{score:>7.2f}% {weight:>7.2f} {contribution*100:>15.2f} points")
+            add_line(fmt(title, type_val, score, weight, contribution*100))
             
-        print("-" * 80)
+        lines.append(_DASH80)
         
         current_final_grade, total_weight, score_percent_completed = self.calculate_weighted_score()
 
-        print(f"Total Weight Applied: {total_weight:.2f} ({(total_weight * 100):.0f}%)")
-        print(f"Grade Based on Completed Work: {score_percent_completed:.2f}%")
-        print(f"Current Course Grade (out of 100% total): {current_final_grade:.2f}%")
-        print("="*80)
+        lines.append(f"Total Weight Applied: {total_weight:.2f} ({(total_weight * 100):.0f}%)")
+        lines.append(f"Grade Based on Completed Work: {score_percent_completed:.2f}%")
+        lines.append(f"Current Course Grade (out of 100% total): {current_final_grade:.2f}%")
+        lines.append(_BAR80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # --- Original Interactive Method (Minor Update to use display_grades) ---
     def start_interactive_entry(self):
@@ -214,6 +369,7 @@ class GradeBook:
             response = input("Do you want to clear these existing entries and start fresh? (yes/no): ").lower()
             if response == 'yes':
                 self.assignment_entries = []
+                self._title_index = {}
                 print("Existing entries cleared from memory.")
             else:
                 # If they say no, load the grades again to ensure we have the disk version
@@ -259,12 +415,14 @@ class GradeBook:
 
     def delete_json_file(self):
         """Deletes the persistent JSON file for this GradeBook instance."""
-        filename = self.get_filename()
+        filename = self._filename
         try:
             os.remove(filename)
             self.assignment_entries = [] # Clear memory after deleting file
-            print(f"[GB SUCCESS] Successfully deleted the GradeBook file: {filename}")
+            self._title_index = {}
+            self._dirty = False
+            log.info("[GB SUCCESS] Successfully deleted the GradeBook file: %s", filename)
         except FileNotFoundError:
-            print(f"[GB WARNING] GradeBook file not found: {filename}")
+            log.warning("[GB WARNING] GradeBook file not found: %s", filename)
         except Exception as e:
-            print(f"[GB ERROR] An error occurred during file deletion: {e}")
+            log.error("[GB ERROR] An error occurred during file deletion: %s", e)
@@ -0,0 +1,39 @@
+# json_io.py
+import json
+
+try:
+    # orjson is an optional, much faster JSON encoder/decoder; fall back to the stdlib if missing.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib one.
+    import orjson
+
+    def _default(obj):
+        """
+        Converts number subclasses orjson refuses but the stdlib json accepts (such as
+        numpy.float64) to plain float/int, so both backends accept the same inputs.
+        """
+        if isinstance(obj, float):
+            return float(obj)
+        if isinstance(obj, int):
+            return int(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    def dumps_compact(obj) -> bytes:
+        """Serializes obj to compact JSON bytes."""
+        return orjson.dumps(obj, default=_default)
+
+    def dumps_indented(obj) -> bytes:
+        """Serializes obj to human-readable (2-space indented) JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+except ImportError:
+    def dumps_compact(obj) -> bytes:
+        """Serializes obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def dumps_indented(obj) -> bytes:
+        """Serializes obj to human-readable (2-space indented) JSON bytes."""
+        # ensure_ascii=False keeps the bytes identical to orjson's UTF-8 output
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    loads = json.loads
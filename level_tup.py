@@ -5,9 +5,14 @@
     is Forms 11-14. 
     For Higher eduction, there are programs for: Associate, Bachelors, Masters, Doctorate, Post-Doctorate 
     """
+import sys
+from types import MappingProxyType
 
 
-Level = ('Nursery', 
+# Level names are interned so comparisons and dict lookups against them can take the
+# identity fast path
+Level = tuple(sys.intern(name) for name in (
+         'Nursery', 
          'Play School', 
          'Form 1',
          'Form 2',
@@ -27,4 +32,12 @@ Level = ('Nursery',
          'Bachelors',
          'Masters',
          'Doctorate',
-         'Post Doctorate')
\ No newline at end of file
+         'Post Doctorate'))
+
+# Read-only lookup from a level name to its ordinal in Level (e.g., 'Form 5' -> 6), so
+# name -> ordinal conversions are a dict lookup instead of a Level.index() scan
+LEVEL_ORDINAL = MappingProxyType({name: index for index, name in enumerate(Level)})
+
+# Read-only lookup from an index to its level name; .get() gives a bounds-checked lookup
+# that returns None for out-of-range (including negative) indices instead of raising
+LEVEL_BY_INDEX = MappingProxyType(dict(enumerate(Level)))
@@ -0,0 +1,33 @@
+# status_log.py
+import logging
+import sys
+
+
+class StdoutHandler(logging.StreamHandler):
+    """StreamHandler that always writes to the current sys.stdout, so output lands where print() would."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def get_status_logger(name: str) -> logging.Logger:
+    """
+    Returns the logger a module uses for its status messages, printed bare to stdout like print().
+    Callers can silence a module with logging.getLogger(name).setLevel(logging.WARNING), which
+    also skips the formatting; a level set before the module is imported is kept.
+    """
+    log = logging.getLogger(name)
+    if not log.handlers:
+        handler = StdoutHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(handler)
+        # Respect a level the caller configured before importing the module
+        if log.level == logging.NOTSET:
+            log.setLevel(logging.INFO)
+        log.propagate = False
+    return log
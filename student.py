@@ -1,5 +1,30 @@
+import sys
+from bisect import bisect_right
+from collections import Counter
+from operator import mul
+
 from core_identity import CoreIdentity
-from level_tup import Level
+from level_tup import LEVEL_BY_INDEX
+
+# Letter-grade lookup tables: bisect_right(_GRADE_CUTOFFS, percentage) gives an index 0..4
+# into _LETTERS and _GRADE_POINTS (5.0 scale: A=5.0, B=4.0, C=3.0, D=2.0, F=0.0)
+_GRADE_CUTOFFS = (60, 70, 80, 90)
+_LETTERS = ('F', 'D', 'C', 'B', 'A')
+_GRADE_POINTS = (0.0, 2.0, 3.0, 4.0, 5.0)
+
+# Divider lines used by the summary/report views
+_BAR50 = "=" * 50
+_DASH50 = "-" * 50
+_TILDE50 = "~" * 50
+
+
+def _new_grade_columns():
+    """
+    Empty detailed-grade storage for one course, kept column-wise (Structure of Arrays):
+    parallel lists where position i of each list describes the same assignment.
+    """
+    return {'assignment': [], 'score': [], 'weight': [], 'type': []}
+
 
 class Student(CoreIdentity):
     """
@@ -8,20 +33,18 @@ class Student(CoreIdentity):
     but contains its own methods, including viewing grades, checking enrollment, 
     and viewing extra information like extracurriculars and SSL hours.
     """
+
+    # Fixed attribute layout instead of a per-instance __dict__ (CoreIdentity is slotted too)
+    __slots__ = ('school', 'entry_year', 'sid', 'rfid', 'log_un', 'log_pas', 'enroll_status',
+                 'enrolled_courses', '_enrolled_courses_set', 'report_card',
+                 '_detailed_grades', '_assignment_pos', '_pct_cache', '_grade_dirty',
+                 '_gpa_stale',
+                 'extra', '_extra_set', 'ssl', 'gpa', 'c_gpa', 'library', 'grade_level')
     
     # --- Helper Function for Grading (Pure Python) ---
     def _calculate_letter_grade(self, percentage):
         """Converts a final percentage score to a letter grade based on a standard scale."""
-        if percentage >= 90:
-            return 'A'
-        elif percentage >= 80:
-            return 'B'
-        elif percentage >= 70:
-            return 'C'
-        elif percentage >= 60:
-            return 'D'
-        else:
-            return 'F'
+        return _LETTERS[bisect_right(_GRADE_CUTOFFS, percentage)]
 
     def __init__(self, 
                  # New Student Attributes (Mandatory)
@@ -56,22 +79,35 @@ class Student(CoreIdentity):
         # --- Critical Grade/Enrollment Attributes ---
         # The list of courses the student is currently taking (e.g., ['XenoMath', 'Quantum Theory'])
         self.enrolled_courses = enrolled_courses if enrolled_courses is not None else []
+        # Set mirror of enrolled_courses for O(1) membership checks (the list keeps display order)
+        self._enrolled_courses_set = set(self.enrolled_courses)
         # Initializing for single letter grades (The Report Card view)
         self.report_card = {}
         # Initializing for detailed assignment grades (The Portal View/Master Book Data)
+        # Each course maps to parallel 'assignment'/'score'/'weight'/'type' lists (see _new_grade_columns)
         self._detailed_grades = {}
+        # Per-course index of assignment name -> position in that course's columns
+        self._assignment_pos = {}
+        # Cached weighted percentage per course (None = no assignments), and the courses whose
+        # assignments changed since their percentage was cached (see _course_percentage)
+        self._pct_cache = {}
+        self._grade_dirty = set()
+        # True when gpa/report_card may be out of date (cleared by update_gpa)
+        self._gpa_stale = True
 
         # Add:
         for course in self.enrolled_courses:
             if course not in self._detailed_grades:
-                self._detailed_grades[course] = []
+                self._detailed_grades[course] = _new_grade_columns()
+                self._assignment_pos[course] = {}
         
         # --- Extracurricular Attributes ---
         self.extra = []
+        self._extra_set = set() # Set mirror of extra for O(1) membership checks
         self.ssl = 500 # Set a new attribute for SSL hours
         self.gpa = 5.0 # Set a new attribute for GPA (lets say the system has 0 - 5.0)
         self.c_gpa = 5.0 # Set a new attrigbute for cumualtive GPA 
-        self.library = [] # Set library material check out (as list)
+        self.library = Counter() # Set library material check out (item name -> times checked out)
 
         # Initialize grade level index (for set_grade function)
         self.set_grade(grade_index)
@@ -83,11 +119,12 @@ class Student(CoreIdentity):
         Sets the student's grade level (Form/Program) by looking up the provided 
         integer index in the external 'Level' tuple. This is run during initialization.
         """
-        try:
-            # Look up the level name using the index
-            self.grade_level = Level[index]
+        # Look up the level name using the index (None if the index is out of range)
+        level = LEVEL_BY_INDEX.get(index)
+        if level is not None:
+            self.grade_level = level
             print(f"Level set to: {self.grade_level}")
-        except IndexError:
+        else:
             self.grade_level = "Invalid Level Index"
             print(f"Error: Index {index} is out of range for the defined school levels.")
 
@@ -121,33 +158,48 @@ class Student(CoreIdentity):
     
     def academic_summary(self, current_year):
         """Prints a detailed summary of the student's academic standing and identification."""
-        print(50 * "-")
-        print(f"Student Summary for {self.full_name_simple()} (Level: {self.grade_level})\
-            \nAcademic Year: {current_year}")
-        print(f"Enrollment: {self.enroll_status} | SID: {self.sid}")
-        print(f"Current GPA: {self.gpa:.2f} | Cumulative GPA: {self.c_gpa:.2f}")
-        print(f"SSL Hours Completed: {self.ssl}")
-        print(50 * "-")
+        name, level, gpa, c_gpa = self.full_name_simple(), self.grade_level, self.gpa, self.c_gpa
+        sys.stdout.write(
+            f"{_DASH50}\n"
+            f"Student Summary for {name} (Level: {level})            \nAcademic Year: {current_year}\n"
+            f"Enrollment: {self.enroll_status} | SID: {self.sid}\n"
+            f"Current GPA: {gpa:.2f} | Cumulative GPA: {c_gpa:.2f}\n"
+            f"SSL Hours Completed: {self.ssl}\n"
+            f"{_DASH50}\n"
+        )
 
     # --- Course Enrollment Management (NEW SECTION) ---
     def register_course(self, course_name):
         """Adds a course to the student's enrolled list if not already registered."""
-        if course_name not in self.enrolled_courses:
+        if course_name not in self._enrolled_courses_set:
+            self._enrolled_courses_set.add(course_name)
             self.enrolled_courses.append(course_name)
-            self._detailed_grades[course_name] = [] # Initialize grade structure
+            self._detailed_grades[course_name] = _new_grade_columns() # Initialize grade structure
+            self._assignment_pos[course_name] = {}
+            self._grade_dirty.add(course_name)
+            self._gpa_stale = True
             print(f"[Enrollment] {self.full_name_simple()} successfully enrolled in {course_name}.")
         else:
             print(f"[Enrollment Warning] {self.full_name_simple()} is already enrolled in {course_name}.")
 
+    def is_enrolled(self, course_name):
+        """Returns True if the student is enrolled in course_name (O(1) set lookup)."""
+        return course_name in self._enrolled_courses_set
+
     def drop_course(self, course_name):
         """Removes a course from the student's enrolled list."""
-        if course_name in self.enrolled_courses:
+        if course_name in self._enrolled_courses_set:
+            self._enrolled_courses_set.discard(course_name)
+            # list.remove keeps the remaining courses in enrollment order, which the
+            # report card relies on; the set check above already avoids scanning on a miss
             self.enrolled_courses.remove(course_name)
-            # Optionally remove related grade data
-            if course_name in self._detailed_grades:
-                del self._detailed_grades[course_name]
-            if course_name in self.report_card:
-                del self.report_card[course_name]
+            # Optionally remove related grade data (single lookup each)
+            self._detailed_grades.pop(course_name, None)
+            self._assignment_pos.pop(course_name, None)
+            self.report_card.pop(course_name, None)
+            self._pct_cache.pop(course_name, None)
+            self._grade_dirty.discard(course_name)
+            self._gpa_stale = True
             print(f"[Enrollment] {self.full_name_simple()} successfully dropped {course_name}.")
         else:
             print(f"[Enrollment Warning] {self.full_name_simple()} is not enrolled in {course_name}.")
@@ -156,7 +208,8 @@ class Student(CoreIdentity):
     # --- Extracurricular and Service Management (NEW SECTION) ---
     def add_extracurricular(self, activity_name):
         """Adds an activity to the student's extracurricular list."""
-        if activity_name not in self.extra:
+        if activity_name not in self._extra_set:
+            self._extra_set.add(activity_name)
             self.extra.append(activity_name)
             print(f"[Activity Log] Added '{activity_name}' to {self.first_name}'s activities.")
         else:
@@ -176,19 +229,30 @@ class Student(CoreIdentity):
 
     def view_extracurriculars(self):
         """Displays the student's list of extracurricular activities and SSL hours."""
-        print(50 * "~")
-        print(f"Extracurricular and Service Summary for {self.full_name_simple()}:")
-        print(f"SSL Hours Completed: {self.ssl:.1f}")
+        lines = [
+            _TILDE50,
+            f"Extracurricular and Service Summary for {self.full_name_simple()}:",
+            f"SSL Hours Completed: {self.ssl:.1f}",
+        ]
         if self.extra:
-            print("Activities:")
-            for activity in self.extra:
-                print(f"- {activity}")
+            lines.append("Activities:")
+            lines.extend([f"- {activity}" for activity in self.extra])
         else:
-            print("No extracurricular activities logged.")
-        print(50 * "~")
+            lines.append("No extracurricular activities logged.")
+        lines.append(_TILDE50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
     # --- Grade Management Methods (The Portal View Data Setter) ---
+    def _ensure_course_grades(self, course_name):
+        """Creates the grade columns for a course (enrolling the student) if they do not exist yet."""
+        if course_name not in self._detailed_grades:
+            self._detailed_grades[course_name] = _new_grade_columns()
+            self._assignment_pos[course_name] = {}
+            if course_name not in self._enrolled_courses_set:
+                self._enrolled_courses_set.add(course_name)
+                self.enrolled_courses.append(course_name)
+
     def add_assignment_grade(self, course_name, assignment_name, score, weight, assignment_type=None):
         """
         Adds a single assignment grade and its weight to the student's detailed record.
@@ -196,10 +260,7 @@ class Student(CoreIdentity):
         """
         ### Extra Precaution ###
         # Make add_assignment_grade auto-initialize course to avoid errors
-        if course_name not in self._detailed_grades:
-            self._detailed_grades[course_name] = []
-            if course_name not in self.enrolled_courses:
-                self.enrolled_courses.append(course_name)
+        self._ensure_course_grades(course_name)
 
         if course_name not in self._detailed_grades:
             print(f"[Grade Error] Cannot add assignment. Student is not enrolled in {course_name}. Use register_course() first.")
@@ -210,49 +271,97 @@ class Student(CoreIdentity):
         weight = max(0.0, min(1.0, weight))
         
         # Check if the assignment already exists and update it, otherwise append new
-        found = False
-        for assignment in self._detailed_grades[course_name]:
-            if assignment['assignment'] == assignment_name:
-                assignment['score'] = score
-                assignment['weight'] = weight
-                assignment['type'] = assignment_type
-                found = True
-                print(f"[Student Grade Update] {assignment_name} updated for {course_name}.")
-                break
-        
-        if not found:
-            self._detailed_grades[course_name].append({
-                'assignment': assignment_name,
-                'score': score,
-                'weight': weight,
-                'type': assignment_type
-            })
+        grades = self._detailed_grades[course_name]
+        positions = self._assignment_pos[course_name]
+        i = positions.get(assignment_name)
+        if i is not None:
+            grades['score'][i] = score
+            grades['weight'][i] = weight
+            grades['type'][i] = assignment_type
+            print(f"[Student Grade Update] {assignment_name} updated for {course_name}.")
+        else:
+            positions[assignment_name] = len(grades['assignment'])
+            grades['assignment'].append(assignment_name)
+            grades['score'].append(score)
+            grades['weight'].append(weight)
+            grades['type'].append(assignment_type)
             print(f"[Student Grade Record] Added {assignment_name} for {course_name}.")
+        self._grade_dirty.add(course_name)
+        self._gpa_stale = True
+
+    def add_assignment_grades_bulk(self, course_name, records):
+        """
+        Adds or updates many assignment grades for one course in a single pass.
+        records is an iterable of (assignment_name, score, weight, assignment_type) tuples. Each row
+        is clamped and stored exactly as add_assignment_grade would, but only one summary line is printed.
+        """
+        self._ensure_course_grades(course_name)
+
+        grades = self._detailed_grades[course_name]
+        positions = self._assignment_pos[course_name]
+        names = grades['assignment']
+        scores = grades['score']
+        weights = grades['weight']
+        types = grades['type']
+        added = updated = 0
+
+        for assignment_name, score, weight, assignment_type in records:
+            # Ensure that score is between 0 and 100 and weight is between 0.0 and 1.0
+            score = max(0, min(100, score))
+            weight = max(0.0, min(1.0, weight))
+
+            i = positions.get(assignment_name)
+            if i is not None:
+                scores[i] = score
+                weights[i] = weight
+                types[i] = assignment_type
+                updated += 1
+            else:
+                positions[assignment_name] = len(names)
+                names.append(assignment_name)
+                scores.append(score)
+                weights.append(weight)
+                types.append(assignment_type)
+                added += 1
+
+        self._grade_dirty.add(course_name)
+        self._gpa_stale = True
+        print(f"[Student Grade Record] {added} added, {updated} updated for {course_name}.")
 
 
+    def _course_percentage(self, course_name):
+        """
+        Returns the weighted final percentage for a course, or None if it has no assignments.
+        The result is cached until add_assignment_grade marks the course dirty again.
+        """
+        pct_cache = self._pct_cache
+        if course_name not in self._grade_dirty and course_name in pct_cache:
+            return pct_cache[course_name]
+
+        grades = self._detailed_grades.get(course_name)
+        if not grades or not grades['assignment']:
+            final_percentage = None
+        else:
+            # Weighted score is the sum of (Score * Weight), reduced over the score/weight columns
+            weights = grades['weight']
+            total_score = sum(map(mul, grades['score'], weights))
+            total_weight = sum(weights)
+            # Final grade is Total Weighted Score / Total Weight
+            final_percentage = 0.0 if total_weight == 0 else total_score / total_weight
+
+        pct_cache[course_name] = final_percentage
+        self._grade_dirty.discard(course_name)
+        return final_percentage
+
     def calculate_final_course_grade(self, course_name):
         """
         Calculates the weighted final grade percentage and letter grade for a specific course.
         Updates the student's self.report_card attribute.
         """
-        if course_name not in self._detailed_grades or not self._detailed_grades[course_name]:
+        final_percentage = self._course_percentage(course_name)
+        if final_percentage is None:
             self.report_card[course_name] = "N/A"
             return 0.0
-
-        total_score = 0
-        total_weight = 0
-
-        for assignment in self._detailed_grades[course_name]:
-            # Calculate weighted score: (Score * Weight)
-            weighted_score = assignment['score'] * assignment['weight']
-            total_score += weighted_score
-            total_weight += assignment['weight']
-
-        if total_weight == 0:
-            final_percentage = 0.0
-        else:
-            # Final grade is Total Weighted Score / Total Weight
-            final_percentage = (total_score / total_weight)
         
         # Convert to letter grade and update the report card attribute
         final_letter = self._calculate_letter_grade(final_percentage)
@@ -265,20 +374,24 @@ class Student(CoreIdentity):
         Calculates the overall GPA for all courses currently in the report card.
         (Simplified 5.0 scale conversion: A=5.0, B=4.0, C=3.0, D=2.0, F=0.0)
         """
-        gpa_map = {'A': 5.0, 'B': 4.0, 'C': 3.0, 'D': 2.0, 'F': 0.0, 'N/A': 0.0}
-        total_gpa_points = 0
+        report_card = self.report_card
+        course_percentage = self._course_percentage
+        total_gpa_points = 0.0
         graded_courses_count = 0
         
-        # Ensure all grades are calculated before running GPA
-        for course in self.enrolled_courses:
-            # Running this ensures the report_card is up-to-date
-            self.calculate_final_course_grade(course) 
-
-        for grade in self.report_card.values():
-            if grade in gpa_map:
-                total_gpa_points += gpa_map[grade]
-                if grade != 'N/A':
-                    graded_courses_count += 1
+        # Refresh the report_card for every enrolled course and accumulate grade points in the
+        # same pass; one cutoff bisect per course indexes both the letter and the point tables.
+        # Courses without assignments are "N/A" and do not count towards the GPA.
+        # dict.fromkeys keeps enrollment order (report card display order) and drops duplicates.
+        for course in dict.fromkeys(self.enrolled_courses):
+            percentage = course_percentage(course)
+            if percentage is None:
+                report_card[course] = "N/A"
+                continue
+            index = bisect_right(_GRADE_CUTOFFS, percentage)
+            report_card[course] = _LETTERS[index]
+            total_gpa_points += _GRADE_POINTS[index]
+            graded_courses_count += 1
         
         if graded_courses_count > 0:
             # Update current GPA (assuming this only covers the current grading period)
@@ -287,6 +400,7 @@ class Student(CoreIdentity):
         else:
             self.gpa = 5.0 # Default/Placeholder if no grades are recorded
             print("[Academic Update] No graded courses to calculate current GPA.")
+        self._gpa_stale = False
 
 
     # --- Data Retrieval Methods (The Instructor & Student Views) ---
@@ -295,71 +409,71 @@ class Student(CoreIdentity):
         Flattens ALL assignment data across ALL courses into a single list of dictionaries.
         This is the method the CourseManager uses to build the Master Gradebook.
         """
-        master_list = []
-        for course_name, assignments in self._detailed_grades.items():
-            for assignment in assignments:
-                # Copy the assignment data and add the course name
-                entry = assignment.copy()
-                entry['course'] = course_name
-                master_list.append(entry)
-        return master_list
+        # Rebuild one row per assignment straight from the columns, adding the course name
+        return [
+            {'assignment': assignment_name, 'score': score, 'weight': weight,
+             'type': assignment_type, 'course': course_name}
+            for course_name, grades in self._detailed_grades.items()
+            for assignment_name, score, weight, assignment_type in zip(
+                grades['assignment'], grades['score'], grades['weight'], grades['type'])
+        ]
 
 
     def view_report_card(self):
         """
         Displays the student's final letter grade for all courses (The Report Card view).
         """
-        print(50 * "=")
-        print(f"OFFICIAL REPORT CARD: {self.full_name_simple()} ({self.grade_level})")
-        # Run GPA calculation before displaying the summary
-        self.update_gpa() 
-        print(f"Current GPA: {self.gpa:.2f}")
-        print(50 * "=")
-        if not self.report_card:
-            print("No final grades available yet.")
-            return
-
-        for course, grade in self.report_card.items():
-            print(f"- {course.ljust(25)} : {grade}")
-        
-        print(50 * "=")
+        sys.stdout.write(f"{_BAR50}\nOFFICIAL REPORT CARD: {self.full_name_simple()} ({self.grade_level})\n")
+        # Run GPA calculation before displaying the summary (it prints its own status line),
+        # unless nothing has changed since the last one
+        if self._gpa_stale:
+            self.update_gpa() 
+
+        # Format the rest of the report as one string
+        report_card = self.report_card
+        if not report_card:
+            body = "No final grades available yet.\n"
+        else:
+            rows = "".join([f"- {course.ljust(25)} : {grade}\n" for course, grade in report_card.items()])
+            body = f"{rows}{_BAR50}\n"
+        sys.stdout.write(f"Current GPA: {self.gpa:.2f}\n{_BAR50}\n{body}")
 
 
     def view_course_grades(self, course_name):
         """
         Displays the detailed assignment results for a single course (The Portal view).
         """
-        print(50 * "-")
-        print(f"Detailed Grades for: {course_name} (SID: {self.sid})")
-        print(50 * "-")
+        lines = [_DASH50, f"Detailed Grades for: {course_name} (SID: {self.sid})", _DASH50]
 
-        if course_name not in self._detailed_grades or not self._detailed_grades[course_name]:
-            print(f"No detailed assignments found for {course_name}.")
+        grades = self._detailed_grades.get(course_name)
+        if not grades or not grades['assignment']:
+            lines.append(f"No detailed assignments found for {course_name}.")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
-        for assignment in self._detailed_grades[course_name]:
-            score = assignment['score']
-            weight = assignment['weight']
-            assignment_name = assignment['assignment']
-            print(f"  {assignment_name.ljust(30)} | Score: {score}/100 | Weight: {weight*100}%")
+        lines.extend([
+            f"  {assignment_name.ljust(30)} | Score: {score}/100 | Weight: {weight*100}%"
+            for assignment_name, score, weight in zip(grades['assignment'], grades['score'], grades['weight'])
+        ])
 
         # Calculate and display the current running grade
         final_percentage = self.calculate_final_course_grade(course_name)
         final_letter = self.report_card.get(course_name, "N/A")
         
-        print(50 * "-")
-        print(f"Current Final Grade: {final_percentage:.2f}% ({final_letter})")
-        print(50 * "-")
+        lines.append(_DASH50)
+        lines.append(f"Current Final Grade: {final_percentage:.2f}% ({final_letter})")
+        lines.append(_DASH50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
     # Updated library item checkout function based on previous idea (expanded by Gemini)
     def lib_checkout(self):
         """
         A simple function for when a student wants to check out materials from the library.
-        Prompts for a comma-separated list, stores items in the object's list, 
+        Prompts for a comma-separated list, tallies items in the object's library Counter, 
         and appends them to a student-specific .txt file for the librarian.
         """
-        print(50 * "-")
+        print(_DASH50)
         print("Library and Media Loan Checkout:")
         
         # 1. Get input as a string
@@ -372,24 +486,22 @@ class Student(CoreIdentity):
             print("No items entered. Checkout cancelled.")
             return
 
-        # 3. Update the student's in-memory list (the library attribute)
-        self.library.extend(request_items)
+        # 3. Update the student's in-memory tally (the library attribute)
+        self.library.update(request_items)
 
         # 4. Use the open() and write() methods to create/append to a .txt file
         # Note: In a real-world web/cloud environment, this would be a database call.
         file_path = f"{self.sid}_library_checkouts.txt"
         try:
             with open(file_path, "a") as lib:
-                for item in request_items:
-                    # Write each item on a new line for easy reading
-                    lib.write(f"{item}\n")
-
-            print(50 * "-")
-            print(f"Summary of checked out items (also recorded in {file_path}): ")
-            for item in request_items:
-                    print(f"- {item}")
+                # Each item goes on its own line for easy reading; written in one call
+                lib.write("\n".join(request_items) + "\n")
+
+            lines = [_DASH50, f"Summary of checked out items (also recorded in {file_path}): "]
+            lines.extend([f"- {item}" for item in request_items])
+            lines.append(_DASH50)
+            sys.stdout.write("\n".join(lines) + "\n")
         except Exception as e:
             # Added more generic error handling for file issues
             print(f"An error occurred during file writing: {e}")
-            
-        print(50 * "-")
+            print(_DASH50)
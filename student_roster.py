@@ -1,7 +1,20 @@
 # student_roster.py
 import json
-import os
-from typing import List, Dict, Any, Union
+import sys
+from typing import List, Dict, Any, Union, Set, Optional
+from json_io import dumps_indented, loads
+
+# Divider lines used by display_roster
+_BAR50 = "=" * 50
+_DASH50 = "-" * 50
+
+
+def _prompt(message: str) -> Optional[str]:
+    """Prompts for one line of input and returns it stripped, or None at end of input."""
+    try:
+        return input(message).strip()
+    except EOFError:
+        return None
 
 class StudentRoster:
     """
@@ -17,43 +30,51 @@ class StudentRoster:
         self.instructor_id = instructor_id
         self.year = year
         self.semester = semester
+        # The filename only depends on the identifiers above, so build it once
+        name_structure = instructor_name.replace(" ", "_")
+        safe_course = course_name.replace(" ", "_")
+        self._filename = f"{safe_course}_{name_structure}_{instructor_id}_{semester}_{year}.json"
         # The roster will store a list of student dictionary identifiers (not Student objects)
         # Each dict: {'name': str, 'id': str, 'course': str}
         self.student_roster: List[Dict[str, str]] = [] 
+        # Set of the IDs in student_roster for O(1) duplicate checks; kept in sync on load/add/remove
+        self._ids_set: Set[str] = set()
         
         # Load existing data upon creation
         self.load_roster()
 
     def get_filename(self) -> str:
-        """Generate file name structure for the student roster to save as a .json file."""
-        name_structure = self.instructor_name.replace(" ", "_")
-        # Dynamically generate file name using course and instructor data
-        safe_course = self.course_name.replace(" ", "_")
-        return f"{safe_course}_{name_structure}_{self.instructor_id}_{self.semester}_{self.year}.json"
+        """Returns the file name for the student roster's .json file (computed in __init__)."""
+        return self._filename
 
     def load_roster(self):
         """Loads roster data (list of student dicts) from JSON file into self.student_roster."""
 
-        filename_roster = self.get_filename()
-        if os.path.exists(filename_roster): 
-            try:
-                with open(filename_roster, 'r') as f:
-                    # Load the list of student identifier dictionaries
-                    self.student_roster = json.load(f)
-                    print(f"[Roster] Loaded {len(self.student_roster)} students for {self.course_name};")
-                    print(f"         Instructor {self.instructor_name}; Semester: {self.semester}; Year: {self.year}")
-            except (json.JSONDecodeError, FileNotFoundError):
-                print(f"[Roster] Warning: No valid file found for {filename_roster}. Starting fresh.")
-            except Exception as e:
-                print(f"[Roster] An error occurred during file loading: {e}")
+        filename_roster = self._filename
+        # Open directly instead of checking os.path.exists() first: one syscall, and no race
+        # between the check and the open. A missing file simply means a new roster.
+        try:
+            with open(filename_roster, 'rb') as f:
+                # Load the list of student identifier dictionaries
+                self.student_roster = loads(f.read())
+                self._ids_set = {s.get('id') for s in self.student_roster}
+                print(f"[Roster] Loaded {len(self.student_roster)} students for {self.course_name};")
+                print(f"         Instructor {self.instructor_name}; Semester: {self.semester}; Year: {self.year}")
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            print(f"[Roster] Warning: No valid file found for {filename_roster}. Starting fresh.")
+        except Exception as e:
+            print(f"[Roster] An error occurred during file loading: {e}")
 
     def save_roster(self):
         """Saves the current self.student_roster list to the unique JSON file."""
-        filename_roster = self.get_filename()
+        filename_roster = self._filename
         try:
-            with open(filename_roster, 'w') as f:
-                # json.dump correctly serializes the list of dictionaries
-                json.dump(self.student_roster, f, indent=4)
+            # Serialize before opening so an encoding error cannot truncate the existing file
+            payload = dumps_indented(self.student_roster)
+            with open(filename_roster, 'wb') as f:
+                f.write(payload)
             print(f"\n[Roster] SUCCESS: Roster saved to {filename_roster}.")
         except Exception as e:
             print(f"[Roster] Error saving file {filename_roster}: {e}")
@@ -61,27 +82,31 @@ class StudentRoster:
     # --- NEW FEATURE 1: Display Roster ---
     def display_roster(self):
         """Prints a formatted report of all students in the roster."""
-        print("\n" + "="*50)
-        print(f"Roster for: {self.course_name}")
-        print(f"Instructor: {self.instructor_name} | Term: {self.semester} {self.year}")
-        print("="*50)
+        lines = [
+            "\n" + _BAR50,
+            f"Roster for: {self.course_name}",
+            f"Instructor: {self.instructor_name} | Term: {self.semester} {self.year}",
+            _BAR50,
+        ]
         
         if not self.student_roster:
-            print("The roster is currently empty.")
-            print("="*50)
+            lines.append("The roster is currently empty.")
+            lines.append(_BAR50)
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
-        print(f"{'STUDENT NAME':<30}{'ID':<20}")
-        print("-" * 50)
+        lines.append(f"{'STUDENT NAME':<30}{'ID':<20}")
+        lines.append(_DASH50)
         
-        for student in self.student_roster:
-            name = student.get('name', 'N/A')
-            student_id = student.get('id', 'N/A')
-            print(f"{name:<30}{student_id:<20}")
+        lines.extend([
+            f"{student.get('name', 'N/A'):<30}{student.get('id', 'N/A'):<20}"
+            for student in self.student_roster
+        ])
 
-        print("-" * 50)
-        print(f"Total Students: {len(self.student_roster)}")
-        print("="*50)
+        lines.append(_DASH50)
+        lines.append(f"Total Students: {len(self.student_roster)}")
+        lines.append(_BAR50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # --- NEW FEATURE 2: Remove Student ---
     def remove_student_from_roster(self, student_id: str) -> bool:
@@ -101,6 +126,7 @@ class StudentRoster:
             s for s in self.student_roster 
             if s.get('id') != student_id
         ]
+        self._ids_set.discard(student_id)
         
         if len(self.student_roster) < original_length:
             print(f"[Roster SUCCESS] Student with ID '{student_id}' removed from roster.")
@@ -118,24 +144,31 @@ class StudentRoster:
 
         print("\n--- Starting Interactive Student Roster Entry ---")
         self.display_roster()
+
+        # student_roster is a public list that callers may append to directly, so
+        # rebuild the ID set from it before using the set for duplicate checks
+        self._ids_set = {s.get('id') for s in self.student_roster}
         
         newly_entered_students = []
         while True: 
             # Prompt for name
-            student_name = input("Enter Student's Full Name (or 'done' to finish): ").strip()
+            student_name = _prompt("Enter Student's Full Name (or 'done' to finish): ")
 
-            if student_name.lower() == 'done':
+            # End of input (e.g., the end of a piped file) finishes entry just like 'done'
+            if student_name is None or student_name.lower() == 'done':
                 break
             
             # Prompt for ID
-            student_id = input(f"Enter ID number for {student_name}: ").strip()
+            student_id = _prompt(f"Enter ID number for {student_name}: ")
+            if student_id is None:
+                break
             
             if not student_id:
                 print("Student ID cannot be empty. Skipping entry.")
                 continue
 
             # Check if student is already in the roster by ID (in memory)
-            if any(s['id'] == student_id for s in self.student_roster):
+            if student_id in self._ids_set:
                 print(f"Warning: Student with ID {student_id} is already in the roster. Skipping entry.")
                 continue
 
@@ -148,6 +181,7 @@ class StudentRoster:
             
             # Add to the in-memory roster
             self.student_roster.append(new_student_data)
+            self._ids_set.add(student_id)
             print(f"Roster Update: {student_name} (ID: {student_id}) added to {self.course_name} roster.")
 
         # Save the updated roster list after the loop finished
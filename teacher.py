@@ -1,8 +1,31 @@
+import sys
 from core_identity import CoreIdentity # Parent class
 from student import Student # We need the Student class type for the roster
 from gradebook import GradeBook
 from student_roster import StudentRoster
-from typing import List
+from status_log import get_status_logger
+from typing import List, Dict, Union, Tuple
+
+# Grade-entry status messages go through this logger, printed to stdout like the gradebook's.
+# Silence them with logging.getLogger('teacher').setLevel(logging.WARNING), which also skips
+# the formatting.
+log = get_status_logger(__name__)
+
+# Fields a GradeBook assignment needs before it can be copied into a Student's grades
+# ('type' is optional and defaults to 'General')
+_TRANSFER_KEYS = frozenset(('title', 'score', 'weight'))
+
+# Divider lines used by course_statement and faculty_summary
+_BAR100 = "=" * 100
+_BAR50 = "=" * 50
+
+
+def _intern(value):
+    """
+    Interns str values (staff IDs, departments, course names) so repeated dict-key lookups
+    and comparisons against them can take the identity fast path; other types pass through.
+    """
+    return sys.intern(value) if type(value) is str else value
 
 class Teacher(CoreIdentity):
     """
@@ -11,6 +34,10 @@ class Teacher(CoreIdentity):
     and methods (like managing grades and generating reports).
     """
 
+    # Fixed attribute layout instead of a per-instance __dict__ (CoreIdentity is slotted too)
+    __slots__ = ('staff_id', 'department', 'courses_taught', '_courses_taught_set',
+                 'student_roster', '_roster_cache', '_instructor_name_cache')
+
     def __init__(self, 
                  # New Teacher Attributes
                  staff_id, department, courses_taught: List[str], 
@@ -29,28 +56,38 @@ class Teacher(CoreIdentity):
                          middle_name, preferred_name)
         
         # 2. Initialize New Teacher Attributes
-        self.staff_id = staff_id # Staff ID
-        self.department = department # Academic department
-        self.courses_taught = courses_taught # List of courses taught
+        self.staff_id = _intern(staff_id) # Staff ID
+        self.department = _intern(department) # Academic department
+        self.courses_taught = [_intern(course) for course in courses_taught] # List of courses taught
+        # Frozen copy of courses_taught for O(1) teaches() checks (the list keeps display order)
+        self._courses_taught_set = frozenset(self.courses_taught)
+
+        # Student objects taught by this teacher, keyed by unique_system_id (insertion-ordered)
+        self.student_roster: Dict[str, Student] = {} 
 
-        # List to hold Student objects taught by this teacher.
-        self.student_roster: List[Student] = [] 
+        # StudentRoster objects already opened by manage_class_roster, keyed by
+        # (course_name, year, semester, instructor name) so each roster file is loaded once
+        self._roster_cache: Dict[Tuple[str, int, str, str], StudentRoster] = {}
+
+    def _reset_name_caches(self):
+        """Also drops the cached instructor name (called by the name setters, including in __init__)."""
+        super()._reset_name_caches()
+        self._instructor_name_cache = None
 
     def instructor_name_simp(self):
         """a simple definition that returns the first and last name of the instructor"""
-        simple_name_message = f"{self.first_name} {self.last_name}"
-        return simple_name_message
+        # Return the cached name if it has already been built (reset by the name setters)
+        if self._instructor_name_cache is None:
+            self._instructor_name_cache = f"{self.first_name} {self.last_name}"
+        return self._instructor_name_cache
 
     def course_statement(self):
         """A simple definition that lists the courses taught by the teacher"""
         taught_courses = self.courses_taught
         # Print statment
-        print(100 * "=")
-        print(f"Courses taught by instructor {self.first_name} {self.last_name}:")
-        print(100 * "=")
-
-        for course in taught_courses:
-            print(f"{course}")
+        lines = [_BAR100, f"Courses taught by instructor {self.instructor_name_simp()}:", _BAR100]
+        lines.extend([f"{course}" for course in taught_courses])
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def course_simp(self): 
         """An even more simple definition that gives back the list of the courses taught
@@ -59,32 +96,62 @@ class Teacher(CoreIdentity):
         taught_courses_simp = self.courses_taught
         return taught_courses_simp
 
+    def teaches(self, course_name: str) -> bool:
+        """Returns True if course_name is one of the courses taught by this teacher."""
+        return course_name in self._courses_taught_set
+
     def add_student_to_roster(self, student_object: Student):
         """Adds a student object to the teacher's roster (in-memory)."""
         if isinstance(student_object, Student):
-            self.student_roster.append(student_object)
+            uid = student_object.unique_system_id
+            if uid in self.student_roster:
+                print(f"Roster Warning: {student_object.full_name_simple()} is already on {self.full_name_simple()}'s roster.")
+                return
+            self.student_roster[uid] = student_object
             print(f"Roster Update: {student_object.full_name_simple()} added to {self.full_name_simple()}'s roster.")
         else:
             print(f"Error: Can only add Student objects to the roster.")
 
+    def get_student(self, unique_system_id: str) -> Union[Student, None]:
+        """Returns the Student on this teacher's roster with the given unique_system_id, or None."""
+        return self.student_roster.get(unique_system_id)
+
+    def __str__(self):
+        """The faculty profile block printed by faculty_summary (without a trailing newline)."""
+        return "\n".join((
+            _BAR50,
+            f"🧑‍🏫 Faculty Profile: {self.full_name_simple()} ({self.preferred_name or 'N/A'})",
+            _BAR50,
+            f"Staff ID: {self.staff_id}",
+            f"Department: {self.department}",
+            f"Courses Taught: {', '.join(self.courses_taught)}",
+            f"Total Students on Roster: {len(self.student_roster)}",
+        ))
+
+    def __repr__(self):
+        return f"Teacher(staff_id={self.staff_id!r}, name={self.full_name_simple()!r}, department={self.department!r})"
+
     def faculty_summary(self):
         """Prints a summary of the teacher's faculty status."""
-        print(50 * "=")
-        print(f"🧑‍🏫 Faculty Profile: {self.full_name_simple()} ({self.preferred_name or 'N/A'})")
-        print(50 * "=")
-        print(f"Staff ID: {self.staff_id}")
-        print(f"Department: {self.department}")
-        print(f"Courses Taught: {', '.join(self.courses_taught)}")
-        print(f"Total Students on Roster: {len(self.student_roster)}")
+        # Build the whole profile once (see __str__)
+        sys.stdout.write(f"{self}\n")
 
     def manage_class_roster(self, course_name: str, year: int, semester: str):
         """
         Initializes and manages the StudentRoster object for a specific course/term.
+        Repeat calls for the same course/term return the already-loaded roster; use
+        invalidate_roster() to force the next call to reload it from file.
         """
+        course_name = _intern(course_name)
         
         # Automatically pull teacher context
         instructor_name = self.instructor_name_simp()
         instructor_id = self.staff_id
+
+        key = (course_name, year, semester, instructor_name)
+        course_roster = self._roster_cache.get(key)
+        if course_roster is not None:
+            return course_roster
         
         # 1. Instantiate the Roster, which auto-loads existing data from file
         course_roster = StudentRoster(
@@ -99,22 +166,30 @@ class Teacher(CoreIdentity):
         # Note: This line would require user input when run.
         # course_roster.start_interactive_entry()
         
+        self._roster_cache[key] = course_roster
         return course_roster
 
+    def invalidate_roster(self, course_name: str, year: int, semester: str):
+        """Drops the cached StudentRoster for a course/term so the next manage_class_roster call reloads it."""
+        self._roster_cache.pop((course_name, year, semester, self.instructor_name_simp()), None)
+
         
     # --- GRADE MANAGEMENT METHODS (FIXED) --- #
 
     def enter_assignment_grade(self, student_obj: Student, course_name: str, 
                                assignment_name: str, score: float, weight: float, 
-                               assignment_type: str): # FIX: Added assignment_type
+                               assignment_type: str, # FIX: Added assignment_type
+                               verbose: bool = True):
         """
         Teacher method to record a grade, its weight, and its type for a specific 
-        student and course.
+        student and course. Pass verbose=False to skip the status header line (warnings are still reported).
         """
-        if course_name not in student_obj.enrolled_courses:
-             print(f"Warning: {student_obj.full_name_simple()} is not officially enrolled in {course_name}.")
+        course_name = _intern(course_name)
+        if not student_obj.is_enrolled(course_name):
+             log.warning("Warning: %s is not officially enrolled in %s.", student_obj.full_name_simple(), course_name)
 
-        print(f"\n--- Entering Grade for {student_obj.full_name_simple()} in {course_name} ---")
+        if verbose:
+            log.info("\n--- Entering Grade for %s in %s ---", student_obj.full_name_simple(), course_name)
         
         # Calling the student object method (assumed to be updated in student.py)
         student_obj.add_assignment_grade(
@@ -126,45 +201,77 @@ class Teacher(CoreIdentity):
         )
 
     
-    def calculate_and_report_grade(self, student_obj: Student, course_name: str):
+    def calculate_and_report_grade(self, student_obj: Student, course_name: str, verbose: bool = True):
         """
         Teacher triggers the final weighted grade calculation for the student in one course,
         which updates the student's internal 'report_card' attribute.
+        Pass verbose=False to skip the status lines.
         """
-        print(f"\n--- Calculating Final Grade for {student_obj.full_name_simple()} in {course_name} ---")
+        if verbose:
+            log.info("\n--- Calculating Final Grade for %s in %s ---", student_obj.full_name_simple(), course_name)
         final_percentage = student_obj.calculate_final_course_grade(course_name)
         
         # Optional: Print the result of the update
         letter_grade = student_obj.report_card.get(course_name, "N/A")
-        print(f"Final Grade Calculated: {final_percentage:.2f}% ({letter_grade}).")
-        print("Student's internal report card has been updated.")
+        if verbose:
+            log.info("Final Grade Calculated: %.2f%% (%s).", final_percentage, letter_grade)
+            log.info("Student's internal report card has been updated.")
         
         return letter_grade
 
-    def bulk_add_grades_from_gradebook(self, student_obj: Student, course_name: str, gradebook: GradeBook):
+    def calculate_class_grades(self, course_name: str) -> Dict[str, Tuple[float, str]]:
+        """
+        Calculates the final weighted grade in one course for every student on this teacher's
+        roster who is enrolled in it, updating each student's 'report_card' without per-student output.
+        Returns {unique_system_id: (final percentage, letter grade)}.
+        """
+        results = {}
+        for uid, student_obj in self.student_roster.items():
+            if not student_obj.is_enrolled(course_name):
+                continue
+            final_percentage = student_obj.calculate_final_course_grade(course_name)
+            results[uid] = (final_percentage, student_obj.report_card.get(course_name, "N/A"))
+
+        log.info("\n--- Calculated Final Grades for %d student(s) in %s ---", len(results), course_name)
+        return results
+
+    def bulk_add_grades_from_gradebook(self, student_obj: Student, course_name: str, gradebook: GradeBook,
+                                       verbose: bool = True):
         """
         Utility to loop through a single GradeBook instance and push all recorded
         assignments into the student's detailed grade list.
+        Pass verbose=False to skip the status lines (warnings are still reported).
         """
-        print(f"\n--- Bulk Adding Assignments from {gradebook.get_filename()} to {student_obj.full_name_simple()} ---")
+        course_name = _intern(course_name)
+        if verbose:
+            log.info("\n--- Bulk Adding Assignments from %s to %s ---", gradebook.get_filename(), student_obj.full_name_simple())
         
         if not gradebook.assignment_entries: 
-            print("GradeBook is empty. No assignments transferred.")
+            if verbose:
+                log.info("GradeBook is empty. No assignments transferred.")
             return
 
+        # Split the entries into (title, score, weight, type) records and malformed rows
+        # missing a required key ('score', 'title', 'weight'), then hand the records to the
+        # student in one batch instead of one enter_assignment_grade call per row
+        records = []
+        skipped = []
+        add_record = records.append
         for assignment in gradebook.assignment_entries:
-            try:
+            if _TRANSFER_KEYS <= assignment.keys():
                 # FIX: We now retrieve and pass the assignment type, defaulting to 'General' if missing
-                assignment_type = assignment.get('type', 'General') 
-
-                self.enter_assignment_grade(
-                    student_obj=student_obj,
-                    course_name=course_name,
-                    assignment_name=assignment['title'], # GradeBook uses 'title'
-                    score=assignment['score'], 
-                    weight=assignment['weight'],
-                    assignment_type=assignment_type # FIX: Pass the assignment type
-                )
-            except KeyError as e:
-                # Catching if required keys ('score', 'title', 'weight') are missing
-                print(f"Error: Assignment missing required field: {e}. Skipping entry: {assignment}")
+                add_record((assignment['title'], # GradeBook uses 'title'
+                            assignment['score'],
+                            assignment['weight'],
+                            assignment.get('type', 'General')))
+            else:
+                skipped.append(assignment)
+
+        if records:
+            if not student_obj.is_enrolled(course_name):
+                log.warning("Warning: %s is not officially enrolled in %s.", student_obj.full_name_simple(), course_name)
+            student_obj.add_assignment_grades_bulk(course_name, records)
+
+        if skipped:
+            log.warning("Error: Skipped %d assignment(s) missing a required field ('title', 'score', 'weight'): %s",
+                        len(skipped), skipped)